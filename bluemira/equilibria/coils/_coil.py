@@ -337,8 +337,11 @@ class Coil(CoilFieldsMixin):
     @position.setter
     def position(self, values: np.ndarray):
         """Set coil position"""
-        self.x = values[0]
-        self.z = values[1]
+        # Set both coordinates before re-discretising, rather than through the
+        # x and z setters, which would re-discretise the coil twice
+        self._x = np.maximum(floatify(values[0]), 0)
+        self._z = floatify(values[1])
+        self._re_discretise()
 
     @ctype.setter
     def ctype(self, value: str | np.ndarray | CoilType):
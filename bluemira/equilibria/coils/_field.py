@@ -58,24 +58,37 @@ class CoilGroupFieldsMixin:
         Calculate poloidal flux at (x, z) due to a unit current
         """
         x, z = np.ascontiguousarray(x), np.ascontiguousarray(z)
+        weighting = self._quad_weighting
 
-        ind = np.nonzero(self._quad_weighting)
-        out = np.zeros((*x.shape, *self._quad_x.shape))
+        if 0 not in weighting:
+            # No zero-weight quadrature padding: evaluate the Green's function
+            # over the whole quadrature block, without the zero-fill and scatter
+            out = greens_psi(
+                self._quad_x,
+                self._quad_z,
+                x.reshape(*x.shape, *(1,) * weighting.ndim),
+                z.reshape(*z.shape, *(1,) * weighting.ndim),
+                self._quad_dx,
+                self._quad_dz,
+            )
+        else:
+            ind = np.nonzero(weighting)
+            out = np.zeros((*x.shape, *self._quad_x.shape))
 
-        out[(*(slice(None) for _ in x.shape), *ind)] = greens_psi(
-            self._quad_x[ind][np.newaxis],
-            self._quad_z[ind][np.newaxis],
-            x[..., np.newaxis],
-            z[..., np.newaxis],
-            self._quad_dx[ind][np.newaxis],
-            self._quad_dz[ind][np.newaxis],
-        )
+            out[(*(slice(None) for _ in x.shape), *ind)] = greens_psi(
+                self._quad_x[ind][np.newaxis],
+                self._quad_z[ind][np.newaxis],
+                x[..., np.newaxis],
+                z[..., np.newaxis],
+                self._quad_dx[ind][np.newaxis],
+                self._quad_dz[ind][np.newaxis],
+            )
 
         return np.squeeze(
             np.einsum(
                 self._einsum_str,
                 out,
-                self._quad_weighting[np.newaxis],
+                weighting[np.newaxis],
             )
         )
 
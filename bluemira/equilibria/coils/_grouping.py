@@ -494,18 +494,23 @@ class CoilGroup(CoilGroupFieldsMixin):
 
         self._einsum_str = "...j, ...j -> ..."
 
-    def _find_coil(self, name):
-        """Find coil by name"""
+    def _lookup_coil(self, name) -> Coil | None:
+        """Find coil by name, returning None when it is not in the group"""
         for c in self._coils:
             if isinstance(c, CoilGroup):
-                try:
-                    return c._find_coil(name)
-                except KeyError:
-                    pass
+                found = c._lookup_coil(name)
+                if found is not None:
+                    return found
             elif c.name == name:
                 return c
+        return None
 
-        raise KeyError(f"Coil '{name}' not found in Group")
+    def _find_coil(self, name):
+        """Find coil by name"""
+        coil = self._lookup_coil(name)
+        if coil is None:
+            raise KeyError(f"Coil '{name}' not found in Group")
+        return coil
 
     def _get_coiltype(self, ctype: CoilType | str) -> list[Coil]:
         """Find coil by type"""
@@ -520,7 +525,13 @@ class CoilGroup(CoilGroupFieldsMixin):
 
     def all_coils(self) -> list[Coil]:
         """Get all coils as a flattened list (no CoilGroups)"""
-        return [self[n] for n in self.name]
+        coils = []
+        for c in self._coils:
+            if isinstance(c, CoilGroup):
+                coils.extend(c.all_coils())
+            else:
+                coils.append(c)
+        return coils
 
     def get_coiltype(self, ctype: str | CoilType) -> CoilGroup | None:
         """Get coils matching coil type"""
@@ -938,8 +949,18 @@ class SymmetricCircuit(Circuit):
     @Circuit.position.setter
     def position(self, values: np.ndarray):
         """Set coil positions"""
-        self.x = values[0]
-        self.z = values[1]
+        new_x, new_z = values[0], values[1]
+        if isinstance(new_x, np.ndarray):
+            new_x = np.mean(new_x[0])
+        if isinstance(new_z, np.ndarray):
+            new_z = np.mean(new_z[0])
+        # Move the primary group in both axes before mirroring, so the
+        # symmetric group is corrected with a single _symmetrise pass
+        self.primary_group.x += new_x - self._get_primary_group_x_centre()
+        self.primary_group.z += new_z - self._get_primary_group_z_centre()
+        diff = self._symmetrise()
+        self.symmetric_group.x -= diff[0]
+        self.symmetric_group.z -= diff[1]
 
     @Circuit.x.setter
     def x(self, new_x: float):
@@ -1038,7 +1059,13 @@ class CoilSet(CoilSetFieldsMixin, CoilGroup):
 
     """
 
-    __slots__ = ("_control", "_control_ind", *CoilGroup.__slots__)
+    __slots__ = (
+        "_all_control",
+        "_control",
+        "_control_coils",
+        "_control_ind",
+        *CoilGroup.__slots__,
+    )
 
     def __init__(
         self,
@@ -1079,18 +1106,31 @@ class CoilSet(CoilSetFieldsMixin, CoilGroup):
         else:
             self._control_ind = []
         self._control = [names[c] for c in self._control_ind]
+        self._control_coils = None
+        self._all_control = self._control_ind == list(range(len(names)))
+
+    def add_coil(self, *coils: Coil | CoilGroup):
+        """Add coils to the set"""
+        super().add_coil(*coils)
+        self._control_coils = None
+        # The new coils are not in the control list, so the control indices no
+        # longer cover the whole set
+        self._all_control = False
 
     def get_control_coils(self) -> CoilSet:
         """Get control coils"""
-        coils = []
-        for c in self._coils:
-            if isinstance(c, CoilSet):
-                coils.extend(c.get_control_coils()._coils)
-            elif (isinstance(c, Coil) and c.name in self.control) or (
-                isinstance(c, CoilGroup) and any(n in self.control for n in c.name)
-            ):
-                coils.append(c)
-        return CoilSet(*coils)
+        if self._control_coils is None:
+            control = set(self.control)
+            coils = []
+            for c in self._coils:
+                if isinstance(c, CoilSet):
+                    coils.extend(c.get_control_coils()._coils)
+                elif (isinstance(c, Coil) and c.name in control) or (
+                    isinstance(c, CoilGroup) and any(n in control for n in c.name)
+                ):
+                    coils.append(c)
+            self._control_coils = CoilSet(*coils)
+        return self._control_coils
 
     @property
     def area(self) -> float:
@@ -1125,7 +1165,9 @@ class CoilSet(CoilSetFieldsMixin, CoilGroup):
         -------
         Summed response output
         """
-        inds = self._control_ind if control else slice(None)
+        # Fancy indexing copies the whole response array: slice instead when
+        # every coil is controlled (the common case)
+        inds = self._control_ind if control and not self._all_control else slice(None)
 
         return np.sum(output[..., inds], axis=-1) if sum_coils else output[..., inds]
 
@@ -1152,6 +1194,84 @@ class CoilSet(CoilSetFieldsMixin, CoilGroup):
         ]
         return self
 
+    @classmethod
+    def from_arrays(
+        cls,
+        x: npt.ArrayLike,
+        z: npt.ArrayLike,
+        dx: npt.ArrayLike | None = None,
+        dz: npt.ArrayLike | None = None,
+        current: npt.ArrayLike = 0.0,
+        name: list[str] | None = None,
+        ctype: str | CoilType = CoilType.NONE,
+        j_max: npt.ArrayLike = np.nan,
+        b_max: npt.ArrayLike = np.nan,
+        *,
+        symmetrised: bool = False,
+    ) -> CoilSet:
+        """
+        Create a CoilSet of single coils from arrays of coil parameters.
+
+        Scalar parameters are broadcast over all coils.
+
+        Parameters
+        ----------
+        x:
+            Coil x positions
+        z:
+            Coil z positions
+        dx:
+            Coil x half-widths
+        dz:
+            Coil z half-heights
+        current:
+            Coil currents
+        name:
+            Coil names. If None, names are generated from the coil type
+        ctype:
+            Type of the coils
+        j_max:
+            Maximum current densities
+        b_max:
+            Maximum fields
+
+        Returns
+        -------
+        A CoilSet with one coil per array entry, all controlled
+
+        Notes
+        -----
+        If symmetrised is True, each coil is wrapped in a SymmetricCircuit
+        about z = 0.
+        """
+        x = np.atleast_1d(x)
+        n_coils = x.size
+        z = np.broadcast_to(z, (n_coils,))
+        dxs = [None] * n_coils if dx is None else np.broadcast_to(dx, (n_coils,))
+        dzs = [None] * n_coils if dz is None else np.broadcast_to(dz, (n_coils,))
+        currents = np.broadcast_to(current, (n_coils,))
+        j_maxs = np.broadcast_to(j_max, (n_coils,))
+        b_maxs = np.broadcast_to(b_max, (n_coils,))
+        names = [None] * n_coils if name is None else name
+
+        coils = [
+            Coil(
+                x[i],
+                z[i],
+                dx=dxs[i],
+                dz=dzs[i],
+                current=currents[i],
+                name=names[i],
+                ctype=ctype,
+                j_max=j_maxs[i],
+                b_max=b_maxs[i],
+            )
+            for i in range(n_coils)
+        ]
+        if symmetrised:
+            coils = [SymmetricCircuit(coil) for coil in coils]
+        return cls(*coils)
+
     def get_optimisation_state(
         self, position_coil_names: list[str] | None = None, current_scale: float = 1.0
     ) -> CoilSetOptimisationState:
@@ -845,6 +845,7 @@ class Equilibrium(CoilSetMHDState):
         self.profiles = profiles
         self._o_points = None
         self._x_points = None
+        self._lcfs = None
         self._solver = None
         self._eqdsk = None
 
@@ -1529,11 +1530,19 @@ class Equilibrium(CoilSetMHDState):
         Returns
         -------
         The Coordinates of the LCFS
+
+        Notes
+        -----
+        The default-argument LCFS is cached alongside the O-X points and
+        cleared on each solve step.
         """
+        default_call = psi is None and psi_n_tol == 1e-6 and delta_start == 0.01  # noqa: PLR2004
+        if default_call and self._lcfs is not None:
+            return deepcopy(self._lcfs)
         if psi is None:
             psi = self.psi()
         o_points, x_points = self.get_OX_points(psi=psi)
-        return find_LCFS_separatrix(
+        lcfs = find_LCFS_separatrix(
             self.x,
             self.z,
             psi,
@@ -1542,6 +1551,10 @@ class Equilibrium(CoilSetMHDState):
             psi_n_tol=psi_n_tol,
             delta_start=delta_start,
         )[0]
+        if default_call:
+            self._lcfs = lcfs
+            return deepcopy(lcfs)
+        return lcfs
 
     def get_separatrix(
         self, psi: npt.NDArray[np.float64] | None = None, psi_n_tol: float = 1e-6
@@ -1580,6 +1593,7 @@ class Equilibrium(CoilSetMHDState):
         """
         self._o_points = None
         self._x_points = None
+        self._lcfs = None
 
     def get_OX_points(
         self, psi: npt.NDArray[np.float64] | None = None, *, force_update: bool = False
@@ -1588,6 +1602,7 @@ class Equilibrium(CoilSetMHDState):
         Returns list of [[O-points], [X-points]]
         """
         if (self._o_points is None and self._x_points is None) or force_update is True:
+            self._lcfs = None
             if psi is None:
                 psi = self.psi()
             self._o_points, self._x_points = find_OX_points(
@@ -274,7 +274,9 @@ class CurrentMidplanceConstraint(ConstraintFunction):
     def f_constraint(self, vector: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
         """Constraint function"""
         self.eq.coilset.get_control_coils().current = self.scale * vector
-        lcfs = self.eq.get_LCFS()
+        # The currents have just changed: pass the recomputed psi explicitly to
+        # bypass the cached default-argument LCFS
+        lcfs = self.eq.get_LCFS(psi=self.eq.psi())
         if self.inboard:
             return self.radius - min(lcfs.x)
         return max(lcfs.x) - self.radius
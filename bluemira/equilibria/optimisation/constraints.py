@@ -404,14 +404,15 @@ class MagneticConstraint(UpdateableConstraint):
         f_constraint: type[ConstraintFunction] = L2NormConstraint,
         constraint_type: str = "inequality",
     ):
-        self.target_value = target_value * np.ones(len(self))
+        self.target_value = np.full(len(self), target_value, dtype=float)
         if tolerance is None:
             tolerance = 1e-3 if target_value == 0 else 1e-3 * target_value
         if is_num(tolerance):
-            if f_constraint == L2NormConstraint:
-                tolerance *= np.ones(1)
-            else:
-                tolerance *= np.ones(len(self))
+            tolerance = np.full(
+                1 if f_constraint == L2NormConstraint else len(self),
+                tolerance,
+                dtype=float,
+            )
         self.weights = weights
         self._f_constraint = f_constraint
         self._args = {"a_mat": None, "b_vec": None, "value": 0.0, "scale": 1.0}
@@ -810,9 +811,11 @@ class MagneticConstraintSet:
                 constraint.update_target(equilibrium)
 
         # Re-build control response matrix
-        if not fixed_coils or (fixed_coils and self.A is None):
+        if not fixed_coils or self.A is None:
             self.build_control_matrix()
-            self.build_target()
+        # Relative constraint targets change with the equilibrium, so the
+        # target vector must be refreshed even when the coils are fixed
+        self.build_target()
 
         self.build_background()
         self.build_weight_matrix()
@@ -84,6 +84,8 @@ class RegularisedLsqObjective(ObjectiveFunction):
         )
         self.b_vec = b_vec
         self.gamma = gamma
+        self._ata_mat = None
+        self._atb_vec = None
 
     def f_objective(self, vector: npt.NDArray[np.float64]) -> float:
         """Objective function for an optimisation."""
@@ -98,8 +100,14 @@ class RegularisedLsqObjective(ObjectiveFunction):
     def df_objective(self, vector: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
         """Gradient of the objective function for an optimisation."""
         vector = vector * self.scale  # nlopt read only  # noqa: PLR6104
-        jac = 2 * self.a_mat.T @ self.a_mat @ vector / float(len(self.b_vec))
-        jac -= 2 * self.a_mat.T @ self.b_vec / float(len(self.b_vec))
+        if self._ata_mat is None:
+            # Both blocks are invariant across evaluations: build them once on
+            # the first gradient call
+            n_targets = float(len(self.b_vec))
+            self._ata_mat = 2 * self.a_mat.T @ self.a_mat / n_targets
+            self._atb_vec = 2 * self.a_mat.T @ self.b_vec / n_targets
+        jac = self._ata_mat @ vector
+        jac -= self._atb_vec
         jac += 2 * self.gamma * self.gamma * vector
         return self.scale * jac
 
@@ -178,8 +186,8 @@ def tikhonov(
     if currents_expand_mat is not None:
         a_mat = a_mat @ currents_expand_mat  # nlopt read only  # noqa: PLR6104
     try:
-        return np.dot(
-            np.linalg.inv(np.dot(a_mat.T, a_mat) + gamma**2 * np.eye(a_mat.shape[1])),
+        return np.linalg.solve(
+            np.dot(a_mat.T, a_mat) + gamma**2 * np.eye(a_mat.shape[1]),
             np.dot(a_mat.T, b_vec),
         )
     except np.linalg.LinAlgError:
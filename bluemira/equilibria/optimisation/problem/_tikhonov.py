@@ -171,10 +171,16 @@ class UnconstrainedTikhonovCurrentGradientCOP(CoilsetOptimisationProblem):
         self.targets = targets
         self.gamma = gamma
 
-    def optimise(self, **_) -> CoilsetOptimiserResult:
+    def optimise(self, *, fixed_coils: bool = True, **_) -> CoilsetOptimiserResult:
         """
         Optimise the prescribed problem.
 
+        Parameters
+        ----------
+        fixed_coils:
+            Whether the coil positions are fixed, in which case the control
+            response matrix is only built once and reused
+
         Notes
         -----
         The weight vector is used to scale the response matrix and
@@ -184,7 +190,7 @@ class UnconstrainedTikhonovCurrentGradientCOP(CoilsetOptimisationProblem):
         weights[i] = w[i] = sqrt(W[i,i]).
         """
         # Scale the control matrix and magnetic field targets vector by weights.
-        self.targets(self.eq, I_not_dI=False)
+        self.targets(self.eq, I_not_dI=False, fixed_coils=fixed_coils)
         _, a_mat, b_vec = self.targets.get_weighted_arrays()
 
         c_cs = self.eq.coilset.get_control_coils()
@@ -74,7 +74,7 @@ def fitfunc(
     return popt
 
 
-@nb.jit(nopython=True)
+@nb.jit(cache=True, nopython=True)
 def singlepowerfunc(x: float, *args) -> float:
     """
     Single power shape function defined e.g. CREATE stuff
@@ -162,8 +162,8 @@ class DudsonConvergence(ConvergenceCriterion):
         True if the convergence criterion is met, else False.
         """
         dpsi = psi_old - psi
-        dpsi_max = np.amax(abs(dpsi))
-        dpsi_rel = dpsi_max / (np.amax(psi) - np.amin(psi))
+        np.abs(dpsi, out=dpsi)
+        dpsi_rel = dpsi.max() / np.ptp(psi)
         if print_status:
             bluemira_print_flush(
                 f"EQUILIBRIA G-S iter {i}: relative delta_psi: {100 * dpsi_rel:.2f} %"
@@ -560,8 +560,10 @@ class PicardIterator:
         if self.i > 0 and self.check_converged(print_status=False):
             raise StopIteration
 
-        self._psi_old = self.psi.copy()
-        self._j_tor_old = self.j_tor.copy()
+        # eq.psi() always returns a freshly summed array and _solve does not
+        # modify its input, so the previous maps can be kept by reference
+        self._psi_old = self._psi
+        self._j_tor_old = self._j_tor
         self._solve()
         self._psi = self.eq.psi()
         self._j_tor = self.eq._jtor
@@ -573,9 +575,12 @@ class PicardIterator:
                 make_gif(self.figure_folder, self.pname)
             raise StopIteration
         self._optimise_coilset()
-        self._psi = (
-            1 - self.relaxation
-        ) * self.eq.psi() + self.relaxation * self._psi_old
+        psi = self.eq.psi()
+        if self.relaxation > 0:
+            # Blend in place on the fresh array to avoid two grid temporaries
+            psi *= 1 - self.relaxation
+            psi += self.relaxation * self._psi_old
+        self._psi = psi
         self.i += 1
 
     def iterate_once(self) -> CoilsetOptimiserResult:
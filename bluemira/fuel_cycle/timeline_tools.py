@@ -302,7 +302,9 @@ class GompertzLearningStrategy(LearningStrategy):
         cum_fpy = np.cumsum(op_durations)
 
         t = np.linspace(0, total_fpy, 100)
-        arg_dates = np.array([np.argmin(abs(t - i)) for i in cum_fpy])
+        # Nearest sample in the (sorted) time vector for each cumulative date
+        arg_dates = np.clip(np.searchsorted(t, cum_fpy), 1, len(t) - 1)
+        arg_dates -= cum_fpy - t[arg_dates - 1] <= t[arg_dates] - cum_fpy
 
         def f_opt(x):
             """
@@ -20,7 +20,6 @@ from typing import TYPE_CHECKING, Any
 import numba as nb
 import numpy as np
 from numba.np.extensions import cross2d
-from scipy.interpolate import interp1d
 from scipy.spatial.distance import cdist
 from scipy.spatial.transform import Rotation
 
@@ -149,9 +148,9 @@ def interpolate_points(
     """
     ll = vector_lengthnorm(x, y, z)
     linterp = np.linspace(0, 1, int(n_points))
-    x = interp1d(ll, x)(linterp)
-    y = interp1d(ll, y)(linterp)
-    z = interp1d(ll, z)(linterp)
+    x = np.interp(linterp, ll, x)
+    y = np.interp(linterp, ll, y)
+    z = np.interp(linterp, ll, z)
     return x, y, z
 
 
@@ -855,7 +854,7 @@ def polygon_in_polygon(
     return inside_array
 
 
-@nb.jit(nopython=True)
+@nb.jit(cache=True, nopython=True)
 def on_polygon(x: float, z: float, poly: npt.NDArray[np.float64]) -> bool:
     """
     Determine if a point (x, z) is on the perimeter of a closed 2-D polygon.
@@ -28,6 +28,7 @@ from bluemira.base.file import force_file_extension, get_bluemira_path
 from bluemira.base.look_and_feel import bluemira_debug, bluemira_warn
 from bluemira.codes import _freecadapi as cadapi
 from bluemira.geometry.base import BluemiraGeo, GeoMeshable
+from bluemira.geometry.bound_box import BoundingBox
 from bluemira.geometry.compound import BluemiraCompound
 from bluemira.geometry.constants import D_TOLERANCE
 from bluemira.geometry.coordinates import Coordinates
@@ -1594,6 +1595,24 @@ def boolean_fuse(shapes: Iterable[BluemiraGeo], label: str = "") -> BluemiraGeo:
         raise GeometryError(f"Boolean fuse operation failed: {e}") from None
 
 
+def _bounding_boxes_overlap(box_1: BoundingBox, box_2: BoundingBox) -> bool:
+    """
+    Check whether two axis-aligned bounding boxes overlap.
+
+    Returns
+    -------
+    True if the boxes share any volume
+    """
+    return (
+        box_1.x_min <= box_2.x_max
+        and box_2.x_min <= box_1.x_max
+        and box_1.y_min <= box_2.y_max
+        and box_2.y_min <= box_1.y_max
+        and box_1.z_min <= box_2.z_max
+        and box_2.z_min <= box_1.z_max
+    )
+
+
 def boolean_cut(
     shape: BluemiraGeo, tools: BluemiraGeo | Iterable[BluemiraGeo]
 ) -> BluemiraGeo | Iterable[BluemiraGeo]:
@@ -1617,9 +1636,17 @@ def boolean_cut(
         In case the boolean operation fails.
     """
     apishape = shape.shape
-    if not isinstance(tools, Iterable):
-        tools = [tools]
-    apitools = [t.shape for t in tools]
+    tools = [tools] if not isinstance(tools, Iterable) else list(tools)
+
+    # Cutting with a tool that cannot touch the shape is a (slow) no-op in the
+    # CAD kernel: only pass through tools whose bounding boxes overlap. One tool
+    # is always kept so that the cut semantics are unchanged.
+    box = shape.bounding_box
+    overlapping = [t for t in tools if _bounding_boxes_overlap(box, t.bounding_box)]
+    if not overlapping:
+        overlapping = tools[:1]
+
+    apitools = [t.shape for t in overlapping]
     cut_shape = cadapi.boolean_cut(apishape, apitools)
 
     if isinstance(cut_shape, Iterable):
@@ -46,6 +46,8 @@ __all__ = [
     "str_to_latex",
 ]
 
+_FIND_DIGIT = re.compile(r"(\d+)")
+
 
 def gsymbolify(string: str) -> str:
     """
@@ -111,8 +113,7 @@ def make_gif(folder: str, figname: str, file_format: str = "png", *, clean: bool
             fp = Path(folder, filename)
             ims.append(fp)
 
-    find_digit = re.compile("(\\d+)")
-    ims = sorted(ims, key=lambda x: int(find_digit.findall(x)[-1]))
+    ims = sorted(ims, key=lambda x: int(_FIND_DIGIT.findall(x.name)[-1]))
     images = [imageio.imread(fp) for fp in ims]
     if clean:
         for fp in ims:
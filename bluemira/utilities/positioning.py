@@ -14,11 +14,9 @@ import abc
 from typing import TYPE_CHECKING
 
 import numpy as np
-from scipy.spatial import ConvexHull
 
-from bluemira.geometry.constants import D_TOLERANCE, VERY_BIG
-from bluemira.geometry.plane import BluemiraPlane
-from bluemira.geometry.tools import slice_shape
+from bluemira.geometry.constants import VERY_BIG
+from bluemira.geometry.coordinates import vector_lengthnorm
 from bluemira.utilities.error import PositionerError
 from bluemira.utilities.tools import is_num
 
@@ -81,6 +79,44 @@ class PathInterpolator(XZGeometryInterpolator):
     The path is treated as flat in the x-z plane.
     """
 
+    # Number of samples used in the vectorised closest-point search
+    _N_SAMPLES = 1000
+
+    def __init__(self, geometry: BluemiraWire):
+        super().__init__(geometry)
+        self._path_cache = None
+
+    def _sample_path(self):
+        """
+        Lazily discretise the path once, caching normalised length and x-z samples.
+        """
+        if self._path_cache is None:
+            # Discretise following the wire parametrisation, so that the
+            # normalised lengths are consistent with value_at / parameter_at
+            coordinates = self.geometry.discretise(
+                byedges=True, dl=self.geometry.length / self._N_SAMPLES
+            )
+            x, z = (np.ascontiguousarray(c, dtype=np.float64) for c in coordinates.xz)
+            self._path_cache = (vector_lengthnorm(x, np.zeros_like(x), z), x, z)
+        return self._path_cache
+
+    def _project_to_L(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Vectorised closest-point projection of x-z points onto the sampled path.
+        """
+        l_s, x_s, z_s = self._sample_path()
+        dx_s, dz_s = np.diff(x_s), np.diff(z_s)
+        length_2 = dx_s**2 + dz_s**2
+        # Projection parameter of each point onto each segment, in [0, 1]
+        t = (x[:, None] - x_s[:-1]) * dx_s + (z[:, None] - z_s[:-1]) * dz_s
+        t = np.clip(np.divide(t, length_2, out=t, where=length_2 > 0), 0.0, 1.0)
+        d_2 = (x_s[:-1] + t * dx_s - x[:, None]) ** 2 + (
+            z_s[:-1] + t * dz_s - z[:, None]
+        ) ** 2
+        i = d_2.argmin(axis=1)
+        i_pts = np.arange(len(x))
+        return l_s[i] + t[i_pts, i] * (l_s[i + 1] - l_s[i])
+
     def to_xz(
         self, l_values: npt.ArrayLike
     ) -> tuple[float, float] | tuple[np.ndarray, np.ndarray]:
@@ -91,11 +127,8 @@ class PathInterpolator(XZGeometryInterpolator):
         if is_num(l_values):
             return self.geometry.value_at(alpha=l_values)[[0, 2]]
 
-        x, z = np.zeros(len(l_values)), np.zeros(len(l_values))
-        for i, lv in enumerate(l_values):
-            x[i], z[i] = self.geometry.value_at(alpha=lv)[[0, 2]]
-
-        return x, z
+        l_s, x_s, z_s = self._sample_path()
+        return np.interp(l_values, l_s, x_s), np.interp(l_values, l_s, z_s)
 
     def to_L(self, x: npt.ArrayLike, z: npt.ArrayLike) -> float | np.ndarray:
         """
@@ -104,10 +137,7 @@ class PathInterpolator(XZGeometryInterpolator):
         if is_num(x):
             return self.geometry.parameter_at([x, 0, z], tolerance=VERY_BIG)
 
-        l_values = np.zeros(len(x))
-        for i, (xi, zi) in enumerate(zip(x, z, strict=False)):
-            l_values[i] = self.geometry.parameter_at([xi, 0, zi], tolerance=VERY_BIG)
-        return l_values
+        return self._project_to_L(np.asarray(x, dtype=float), np.asarray(z, dtype=float))
 
     @property
     def dimension(self) -> int:
@@ -145,21 +175,54 @@ class RegionInterpolator(XZGeometryInterpolator):
 
     def __init__(self, geometry: BluemiraWire):
         super().__init__(geometry)
-        self._check_geometry_feasibility(geometry)
-        self.z_min = geometry.bounding_box.z_min
-        self.z_max = geometry.bounding_box.z_max
+        xz_coordinates = self._check_geometry_feasibility()
+        self._build_chains(xz_coordinates)
+        # Extents from the discretised boundary, so the normalisation is exactly
+        # consistent with the cached chains (and no CAD bounding-box call)
+        x, z = xz_coordinates
+        self.x_min = x.min()
+        self.x_max = x.max()
+        self.z_min = z.min()
+        self.z_max = z.max()
+
+    def _build_chains(self, xz_coordinates: np.ndarray):
+        """
+        Split the region boundary into two z-monotonic chains.
+
+        For a convex region, any horizontal line crosses each chain exactly once,
+        so the boundary x values at a given z can be interpolated directly rather
+        than re-slicing the geometry.
+        """
+        x, z = xz_coordinates
+        if np.isclose(x[0], x[-1]) and np.isclose(z[0], z[-1]):
+            x, z = x[:-1], z[:-1]
+        i_min = int(np.argmin(z))
+        x, z = np.roll(x, -i_min), np.roll(z, -i_min)
+        i_max = int(np.argmax(z))
+        self._x_chain_1 = x[: i_max + 1]
+        self._z_chain_1 = z[: i_max + 1]
+        self._x_chain_2 = np.append(x[i_max:], x[0])[::-1]
+        self._z_chain_2 = np.append(z[i_max:], z[0])[::-1]
+
+    def _x_at_z(self, z: float) -> tuple[float, float]:
+        """
+        Get the boundary x values of the region at a given height on each chain.
+        """
+        return (
+            np.interp(z, self._z_chain_1, self._x_chain_1),
+            np.interp(z, self._z_chain_2, self._x_chain_2),
+        )
 
-    def _check_geometry_feasibility(self, geometry: BluemiraWire):
+    def _check_geometry_feasibility(self):
         """
         Checks the provided region is convex.
 
         This is a current limitation of RegionInterpolator
         not providing a 'smooth' interpolation surface.
 
-        Parameters
-        ----------
-        geometry:
-            Region to check
+        Returns
+        -------
+        The discretised x-z coordinates of the region boundary
 
         Raises
         ------
@@ -170,17 +233,24 @@ class RegionInterpolator(XZGeometryInterpolator):
             raise PositionerError("RegionInterpolator can only handle closed wires.")
 
         xz_coordinates = self._get_xz_coordinates(10000)
-        hull = ConvexHull(xz_coordinates.T)
-        # Yes, the "area" of a 2-D scipy ConvexHull is its perimeter...
-        if not np.allclose(hull.area, geometry.length, rtol=1e-5, atol=D_TOLERANCE):
+        x, z = xz_coordinates
+        if np.isclose(x[0], x[-1]) and np.isclose(z[0], z[-1]):
+            x, z = x[:-1], z[:-1]
+
+        # A closed boundary is convex if and only if it always turns the same
+        # way: check the consecutive edge cross products for mixed signs, with
+        # a tolerance for discretisation noise on collinear points
+        d_x = np.diff(np.append(x, x[0]))
+        d_z = np.diff(np.append(z, z[0]))
+        cross = d_x * np.roll(d_z, -1) - d_z * np.roll(d_x, -1)
+        tolerance = 1e-4 * np.max(np.abs(cross))
+        if np.any(cross < -tolerance) and np.any(cross > tolerance):
             raise PositionerError(
                 "RegionInterpolator can only handle simple convex geometries. "
-                "Perimeter difference between convex hull and geometry:"
-                f"{hull.area} - {geometry.length} ="
-                f"{hull.area - geometry.length}\n"
-                "This suggests that the shape is"
-                "too complex to be discretised accurately."
+                "The boundary turns in both directions, which suggests that the "
+                "shape is concave."
             )
+        return xz_coordinates
 
     def to_xz(
         self, l_values: tuple[float, float] | tuple[np.ndarray, np.ndarray]
@@ -199,28 +269,12 @@ class RegionInterpolator(XZGeometryInterpolator):
             x coordinate in real space
         z:
             z coordinate in real space
-
-        Raises
-        ------
-        GeometryError
-            When loop is not a Convex Hull
-
         """
         l_0, l_1 = l_values
         z = self.z_min + (self.z_max - self.z_min) * l_1
 
-        plane = BluemiraPlane.from_3_points([0, 0, z], [1, 0, z], [0, 1, z])
-
-        intersect = slice_shape(self.geometry, plane)
-        if len(intersect) == 1:
-            x = intersect[0][0]
-        elif len(intersect) == 2:  # noqa: PLR2004
-            x_min, x_max = sorted([intersect[0][0], intersect[1][0]])
-            x = x_min + (x_max - x_min) * l_0
-        else:
-            raise PositionerError(
-                "Unexpected number of intersections in x-z conversion."
-            )
+        x_min, x_max = sorted(self._x_at_z(z))
+        x = x_min + (x_max - x_min) * l_0
 
         return x, z
 
@@ -243,68 +297,21 @@ class RegionInterpolator(XZGeometryInterpolator):
             Coordinate 1 in normalised space
         l_2:
             Coordinate 2 in normalised space
-
-        Raises
-        ------
-        GeometryError
-            When loop is not a Convex Hull
-
         """
-        l_1 = (z - self.z_min) / (self.z_max - self.z_min)
-        l_1 = np.clip(l_1, 0.0, 1.0)
-
-        plane = BluemiraPlane.from_3_points([x, 0, z], [x + 1, 0, z], [x, 1, z])
-        intersect = slice_shape(self.geometry, plane)
-
-        return self._intersect_filter(x, l_1, intersect)
-
-    def _intersect_filter(
-        self, x: float, l_1: float, intersect: BluemiraPlane
-    ) -> tuple[float, float]:
-        """
-        Checks where points are based on number of intersections
-        with a plane. Should initially be called with a plane involving z.
-
-        No intersection could mean above 1 edge therefore a plane in xy
-        is checked before recalling this function.
-        If there is one intersection point we are on an edge (either bottom or top),
-        if there is two intersection points we are in the region,
-        otherwise the region is not a convex hull.
-
-        Parameters
-        ----------
-        x:
-            x coordinate
-        l_1:
-            Normalised z coordinate
-        intersect:
-            A plane through xz
-
-        Returns
-        -------
-        l_1:
-            Coordinate 1 in normalised space
-        l_2:
-            Coordinate 2 in normalised space
-
-        Raises
-        ------
-        PositionerError
-            When geometry is not a convex
-        """
-        if intersect is None:
-            plane = BluemiraPlane.from_3_points([x, 0, 0], [x + 1, 0, 0], [x, 1, 0])
-            intersect = slice_shape(self.geometry, plane)
-            l_0, l_1 = self._intersect_filter(
-                x, l_1, [False] if intersect is None else intersect
-            )
-        elif len(intersect) == 2:  # noqa: PLR2004
-            x_min, x_max = sorted([intersect[0][0], intersect[1][0]])
-            l_0 = np.clip((x - x_min) / (x_max - x_min), 0.0, 1.0)
-        elif len(intersect) == 1:
-            l_0 = float(l_1 == 1.0)
-        else:
-            raise PositionerError("Unexpected number of intersections in L conversion.")
+        x, z = np.asarray(x, dtype=float), np.asarray(z, dtype=float)
+        l_1 = np.clip((z - self.z_min) / (self.z_max - self.z_min), 0.0, 1.0)
+
+        x_a, x_b = self._x_at_z(np.clip(z, self.z_min, self.z_max))
+        x_min, x_max = np.minimum(x_a, x_b), np.maximum(x_a, x_b)
+        width = x_max - x_min
+        degenerate = np.isclose(width, 0)
+        l_0 = np.clip(
+            np.divide(x - x_min, width, out=np.zeros_like(width), where=~degenerate),
+            0.0,
+            1.0,
+        )
+        # Degenerate slice width at the top or bottom of the region
+        l_0 = np.where(degenerate, (l_1 == 1.0).astype(float), l_0)
         return l_0, l_1
 
     @property
@@ -327,6 +334,9 @@ class PositionMapper:
 
     def __init__(self, interpolators: dict[str, XZGeometryInterpolator]):
         self.interpolators = interpolators
+        # Cumulative offsets of each interpolator in the parametric-space vector
+        dimensions = [tool.dimension for tool in interpolators.values()]
+        self._offsets = np.concatenate([[0], np.cumsum(dimensions)])
 
     def _check_length(self, thing):
         """
@@ -341,11 +351,10 @@ class PositionMapper:
         """
         Convert a vector of l_values into a ragged list if necessary
         """
-        list_values = []
-        for i, interpolator in enumerate(self.interpolators.values()):
-            values = l_values[i : i + interpolator.dimension]
-            list_values.append(values)
-        return list_values
+        return [
+            l_values[start:stop]
+            for start, stop in zip(self._offsets[:-1], self._offsets[1:], strict=False)
+        ]
 
     def to_xz(self, l_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
@@ -410,15 +419,15 @@ class PositionMapper:
         self._check_length(z)
         l_values = np.zeros(self.dimension)
         for i, tool in enumerate(self.interpolators.values()):
-            l_values[i : i + tool.dimension] = tool.to_L(x[i], z[i])
-        return np.array(l_values)
+            l_values[self._offsets[i] : self._offsets[i + 1]] = tool.to_L(x[i], z[i])
+        return l_values
 
     @property
     def dimension(self) -> int:
         """
         The total dimension of the parametric space
         """
-        return sum(interp.dimension for interp in self.interpolators.values())
+        return int(self._offsets[-1])
 
     @property
     def interpolator_names(self) -> list[str]:
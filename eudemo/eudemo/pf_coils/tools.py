@@ -89,45 +89,30 @@ def make_solenoid(
             " than the height available."
         )
 
-    coils = []
     if n_CS == 1:
         # Single CS module solenoid (no gaps)
         module_height = total_height - 2 * tk_inscas
-        coil = make_CS_coil(0.5 * total_height, 0.5 * module_height, 0)
-        coils.append(coil)
+        return [make_CS_coil(0.5 * total_height, 0.5 * module_height, 0)]
 
-    elif n_CS % 2 == 0:
+    if n_CS % 2 == 0:
         # Equally-spaced CS modules for even numbers of CS coils
         module_height = (total_height - total_gaps) / n_CS
-        dz_coil = 0.5 * module_height
-        z_iter = z_max
-        for i in range(n_CS):
-            z_coil = z_iter - tk_inscas - dz_coil
-            coil = make_CS_coil(z_coil, dz_coil, i)
-            coils.append(coil)
-            z_iter = z_coil - dz_coil - tk_inscas - g_cs
-
+        dz_coils = np.full(n_CS, 0.5 * module_height)
     else:
         # Odd numbers of modules -> Make a central module that is twice the size of the
         # others.
         module_height = (total_height - total_gaps) / (n_CS + 1)
-        z_iter = z_max
-        for i in range(n_CS):
-            if i == n_CS // 2:
-                # Central module
-                dz_coil = module_height
-                z_coil = z_iter - tk_inscas - dz_coil
-
-            else:
-                # All other modules
-                dz_coil = 0.5 * module_height
-                z_coil = z_iter - tk_inscas - dz_coil
-
-            coil = make_CS_coil(z_coil, dz_coil, i)
-            coils.append(coil)
-            z_iter = z_coil - dz_coil - tk_inscas - g_cs
-
-    return coils
+        dz_coils = np.full(n_CS, 0.5 * module_height)
+        dz_coils[n_CS // 2] = module_height
+
+    # Module centres from the cumulative stack of modules, insulation and gaps
+    pitch = 2 * dz_coils + 2 * tk_inscas + g_cs
+    z_tops = z_max - np.append(0.0, np.cumsum(pitch[:-1]))
+    z_coils = z_tops - tk_inscas - dz_coils
+    return [
+        make_CS_coil(z_coil, dz_coil, i)
+        for i, (z_coil, dz_coil) in enumerate(zip(z_coils, dz_coils, strict=False))
+    ]
 
 
 def _get_intersections_from_angles(boundary, ref_x, ref_z, angles):
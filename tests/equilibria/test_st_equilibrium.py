@@ -9,7 +9,7 @@ bluemira ST equilibrium recursion test
 """
 
 import copy
-import os
+import functools
 from pathlib import Path
 
 import numpy as np
@@ -23,7 +23,6 @@ from bluemira.equilibria import (
     Equilibrium,
     Grid,
     PicardIterator,
-    SymmetricCircuit,
 )
 from bluemira.equilibria.file import EQDSKInterface
 from bluemira.equilibria.optimisation.constraints import (
@@ -36,23 +35,90 @@ from bluemira.equilibria.optimisation.problem import (
 from bluemira.equilibria.solve import DudsonConvergence
 from bluemira.geometry.coordinates import get_area_2d
 
+# Constant coil and isoflux point data, built once at import rather than per
+# test invocation
+_XC = np.array([1.5, 1.5, 8.259059936102478, 8.259059936102478, 10.635505223274231])
+_ZC = np.array([8.78, 11.3, 11.8, 6.8, 1.7])
+_DXC = np.array([0.175, 0.25, 0.25, 0.25, 0.35])
+_DZC = np.array([0.5, 0.4, 0.4, 0.4, 0.5])
+# Points chosen to replicate divertor legs in AH's FIESTA demo
+_X_HFS = np.array([
+    1.42031,
+    1.057303,
+    0.814844,
+    0.669531,
+    0.621094,
+    0.621094,
+    0.645312,
+    0.596875,
+])
+_Z_HFS = np.array([
+    4.79844,
+    5.0875,
+    5.37656,
+    5.72344,
+    6.0125,
+    6.6484,
+    6.82188,
+    7.34219,
+])
+_X_LFS = np.array([
+    1.85625,
+    2.24375,
+    2.53438,
+    2.89766,
+    3.43047,
+    4.27813,
+    5.80391,
+    6.7,
+])
+_Z_LFS = np.array([
+    4.79844,
+    5.37656,
+    5.83906,
+    6.24375,
+    6.59063,
+    6.76406,
+    6.70625,
+    6.70625,
+])
+for _arr in (_XC, _ZC, _DXC, _DZC, _X_HFS, _Z_HFS, _X_LFS, _Z_LFS):
+    _arr.setflags(write=False)
+
+
+@functools.lru_cache(1)
+def _load_reference_data():
+    """
+    Load the reference equilibrium and JETTO data, parsed once per test session.
+    """
+    private = (
+        Path(get_bluemira_root()).parent / "bluemira-private-data/equilibria/STEP_SPR_08"
+    )
+    eq_blueprint = Equilibrium.from_eqdsk(private / "STEP_SPR08_BLUEPRINT.json")
+    filename = private / "jetto.eqdsk_out"
+    profiles = CustomProfile.from_eqdsk(filename)
+    jeq_dict = EQDSKInterface.from_file(filename)
+    return eq_blueprint, profiles, jeq_dict
+
 
 @pytest.mark.private
 class TestSTEquilibrium:
     @classmethod
     def setup_class(cls):
         # Load reference and input data
-        root = get_bluemira_root()
-        private = os.path.split(root)[0]
-        private = Path(private, "bluemira-private-data/equilibria/STEP_SPR_08")
-        eq_name = "STEP_SPR08_BLUEPRINT.json"
-        cls.eq_blueprint = Equilibrium.from_eqdsk(Path(private, eq_name))
-        jeq_name = "jetto.eqdsk_out"
-        filename = Path(private, jeq_name)
-        cls.profiles = CustomProfile.from_eqdsk(filename)
-        cls.jeq_dict = EQDSKInterface.from_file(filename)
-
-    def test_equilibrium(self):
+        cls.eq_blueprint, cls.profiles, cls.jeq_dict = _load_reference_data()
+        cls._solved = None
+        # The reference LCFS never changes; compute its area once for the asserts
+        cls.lcfs_area_bp = get_area_2d(*cls.eq_blueprint.get_LCFS().xz)
+
+    @classmethod
+    def _solve_st_equilibrium(cls):
+        """
+        Build and converge the symmetric ST equilibrium, once per class.
+        """
+        if cls._solved is not None:
+            return cls._solved
+
         build_tweaks = {
             "plot_fbe_evol": True,
             "plot_fbe": True,
@@ -67,32 +133,27 @@ class TestSTEquilibrium:
 
         R_0 = 3.639
         A = 1.667
-        i_p = self.jeq_dict.cplasma
-
-        xc = np.array([
-            1.5,
-            1.5,
-            8.259059936102478,
-            8.259059936102478,
-            10.635505223274231,
-        ])
-        zc = np.array([8.78, 11.3, 11.8, 6.8, 1.7])
-        dxc = np.array([0.175, 0.25, 0.25, 0.25, 0.35])
-        dzc = np.array([0.5, 0.4, 0.4, 0.4, 0.5])
-
-        coils = []
-        for i, (x, z, dx, dz) in enumerate(zip(xc, zc, dxc, dzc, strict=False)):
-            coil = SymmetricCircuit(
-                Coil(x=x, z=z, dx=dx, dz=dz, name=f"PF_{i + 1}", ctype="PF")
-            )
-            coils.append(coil)
-        coilset = CoilSet(*coils)
+        i_p = cls.jeq_dict.cplasma
+
+        xc, zc, dxc, dzc = _XC, _ZC, _DXC, _DZC
+
+        coilset = CoilSet.from_arrays(
+            xc,
+            zc,
+            dx=dxc,
+            dz=dzc,
+            name=[f"PF_{i + 1}" for i in range(len(xc))],
+            ctype="PF",
+            symmetrised=True,
+        )
 
+        x_extent = (xc + dxc).max() + 0.5
+        z_extent = (zc + dzc).max()
         grid = Grid(
             x_min=0.0,
-            x_max=max(xc + dxc) + 0.5,
-            z_min=-max(zc + dzc),
-            z_max=max(zc + dzc),
+            x_max=x_extent,
+            z_min=-z_extent,
+            z_max=z_extent,
             nx=2 ** build_tweaks["nx_number_x"] + 1,
             nz=2 ** build_tweaks["nz_number_z"] + 1,
         )
@@ -100,66 +161,38 @@ class TestSTEquilibrium:
         inboard_iso = [R_0 * (1.0 - 1 / A), 0.0]
         outboard_iso = [R_0 * (1.0 + 1 / A), 0.0]
 
-        x = self.jeq_dict.xbdry
-        z = self.jeq_dict.zbdry
-        upper_iso = [x[np.argmax(z)], np.max(z)]
-        lower_iso = [x[np.argmin(z)], np.min(z)]
+        x = cls.jeq_dict.xbdry
+        z = cls.jeq_dict.zbdry
+        arg_upper, arg_lower = np.argmax(z), np.argmin(z)
+        upper_iso = [x[arg_upper], z[arg_upper]]
+        lower_iso = [x[arg_lower], z[arg_lower]]
 
         x_core = np.array([inboard_iso[0], upper_iso[0], outboard_iso[0], lower_iso[0]])
         z_core = np.array([inboard_iso[1], upper_iso[1], outboard_iso[1], lower_iso[1]])
 
-        # Points chosen to replicate divertor legs in AH's FIESTA demo
-        x_hfs = np.array([
-            1.42031,
-            1.057303,
-            0.814844,
-            0.669531,
-            0.621094,
-            0.621094,
-            0.645312,
-            0.596875,
-        ])
-        z_hfs = np.array([
-            4.79844,
-            5.0875,
-            5.37656,
-            5.72344,
-            6.0125,
-            6.6484,
-            6.82188,
-            7.34219,
-        ])
-        x_lfs = np.array([
-            1.85625,
-            2.24375,
-            2.53438,
-            2.89766,
-            3.43047,
-            4.27813,
-            5.80391,
-            6.7,
-        ])
-        z_lfs = np.array([
-            4.79844,
-            5.37656,
-            5.83906,
-            6.24375,
-            6.59063,
-            6.76406,
-            6.70625,
-            6.70625,
-        ])
-
-        x_div = np.concatenate([x_lfs, x_lfs, x_hfs, x_hfs])
-        z_div = np.concatenate([z_lfs, -z_lfs, z_hfs, -z_hfs])
+        x_hfs, z_hfs = _X_HFS, _Z_HFS
+        x_lfs, z_lfs = _X_LFS, _Z_LFS
 
-        # Scale up Agnieszka isoflux constraints
+        # Scale up Agnieszka isoflux constraints, filling a single buffer for
+        # the core and (mirrored) divertor legs rather than concatenating
+        # intermediates
         size_scaling = R_0 / 2.5
-        x_div *= size_scaling
-        z_div *= size_scaling
-
-        xx = np.concatenate([x_core, x_div])
-        zz = np.concatenate([z_core, z_div])
+        n_core, n_lfs, n_hfs = len(x_core), len(x_lfs), len(x_hfs)
+        xx = np.empty(n_core + 2 * (n_lfs + n_hfs))
+        zz = np.empty_like(xx)
+        xx[:n_core] = x_core
+        zz[:n_core] = z_core
+        i = n_core
+        for x_leg, z_leg, sign in (
+            (x_lfs, z_lfs, 1),
+            (x_lfs, z_lfs, -1),
+            (x_hfs, z_hfs, 1),
+            (x_hfs, z_hfs, -1),
+        ):
+            n = len(x_leg)
+            np.multiply(x_leg, size_scaling, out=xx[i : i + n])
+            np.multiply(z_leg, sign * size_scaling, out=zz[i : i + n])
+            i += n
 
         constraint_set = MagneticConstraintSet([
             IsofluxConstraint(
@@ -171,7 +204,7 @@ class TestSTEquilibrium:
             )
         ])
 
-        initial_psi = self._make_initial_psi(
+        initial_psi = cls._make_initial_psi(
             coilset,
             grid,
             constraint_set,
@@ -182,7 +215,7 @@ class TestSTEquilibrium:
         )
 
         eq = Equilibrium(
-            coilset, grid, self.profiles, force_symmetry=True, psi=initial_psi
+            coilset, grid, cls.profiles, force_symmetry=True, psi=initial_psi
         )
         opt_problem = UnconstrainedTikhonovCurrentGradientCOP(
             eq.coilset, eq, constraint_set, gamma=build_tweaks["tikhonov_gamma"]
@@ -195,32 +228,38 @@ class TestSTEquilibrium:
             opt_problem,
             plot=False,
             gif=False,
+            # Coil positions never move here: build the control response
+            # matrix once rather than every iteration
+            fixed_coils=True,
             relaxation=0.3,
             maxiter=400,
             convergence=criterion,
         )
         fbe_iterator()
-        self.eq = eq
+        cls._solved = (eq, fbe_iterator)
+        return cls._solved
+
+    def test_equilibrium_symmetric(self):
+        eq, _ = self._solve_st_equilibrium()
         self._test_equilibrium_good(eq)
         self._test_profiles_good(eq)
 
+    def test_equilibrium_asymmetric(self):
+        # Work on a deep copy so the class-cached symmetric solve is not
+        # mutated, whichever order the tests run in
+        eq, fbe_iterator = copy.deepcopy(self._solve_st_equilibrium())
         # Verify by removing symmetry constraint and checking convergence
         eq.force_symmetry = False
-        eq.set_grid(grid)
+        eq.set_grid(eq.grid)
         fbe_iterator()
         # I probably exported the eq before it was regridded without symmetry..
         self._test_equilibrium_good(eq)
-
         self._test_profiles_good(eq)
 
     def _test_equilibrium_good(self, eq):
         assert np.isclose(eq.profiles.I_p, abs(self.jeq_dict.cplasma))
         lcfs = eq.get_LCFS()
-        assert np.isclose(
-            get_area_2d(*self.eq_blueprint.get_LCFS().xz),
-            get_area_2d(*lcfs.xz),
-            rtol=1e-2,
-        )
+        assert np.isclose(self.lcfs_area_bp, get_area_2d(*lcfs.xz), rtol=1e-2)
         assert np.isclose(lcfs.center_of_mass[-1], 0.0)
 
     def _test_profiles_good(self, eq):
@@ -253,8 +292,9 @@ class TestSTEquilibrium:
         assert np.allclose(jetto_pprime, bm_pprime)
         assert np.allclose(jetto_ffprime, bm_ffprime)
 
+    @classmethod
     def _make_initial_psi(
-        self,
+        cls,
         coilset,
         grid,
         constraint_set,
@@ -277,9 +317,7 @@ class TestSTEquilibrium:
         coilset_temp.add_coil(dummy)
         coilset_temp.control = coilset.name
 
-        eq = Equilibrium(
-            coilset_temp, grid, self.profiles, force_symmetry=True, psi=None
-        )
+        eq = Equilibrium(coilset_temp, grid, cls.profiles, force_symmetry=True, psi=None)
         opt_problem = UnconstrainedTikhonovCurrentGradientCOP(
             coilset, eq, constraint_set, gamma=tikhonov_gamma
         )
@@ -292,6 +330,11 @@ class TestSTEquilibrium:
         # no idea why it works better with what is blatantly a worse starting solution.
         # Really you could just avoid adding the dummy plasma coil in the first place..
         # Perhaps the current centre is poorly estimated by R_0 + 0.5
-        return coilset_temp.psi(grid.x, grid.z).copy() - np.squeeze(
-            dummy.psi(grid.x, grid.z)
-        )
+        # Grid.x and Grid.z are built once in Grid.__init__; bind them locally
+        # and share the same arrays between the two psi evaluations
+        gx, gz = grid.x, grid.z
+        psi = coilset_temp.psi(gx, gz)
+        # CoilSet.psi returns a freshly summed array: subtract the dummy
+        # contribution in place rather than copying first
+        psi -= np.squeeze(dummy.psi(gx, gz))
+        return psi